@@ -3,104 +3,187 @@ from firedrake.__future__ import *
 import pytest
 import numpy as np
 from mpi4py import MPI
+from functools import reduce
+from operator import mul
+import weakref
 
 
 # Utility Functions
 
-@pytest.fixture(params=["interval",
-                        "square",
-                        "squarequads",
-                        "extruded",
-                        pytest.param("extrudedvariablelayers", marks=pytest.mark.skip(reason="Extruded meshes with variable layers not supported and will hang when created in parallel")),
-                        "cube",
-                        "tetrahedron",
-                        "immersedsphere",
-                        "immersedsphereextruded",
-                        "periodicrectangle",
-                        "shiftedmesh"])
+_PARENTMESH_PARAMS = ("interval",
+                      "square",
+                      "squarequads",
+                      "extruded",
+                      pytest.param("extrudedvariablelayers", marks=pytest.mark.skip(reason="Extruded meshes with variable layers not supported and will hang when created in parallel")),
+                      "cube",
+                      "tetrahedron",
+                      "immersedsphere",
+                      "immersedsphereextruded",
+                      "periodicrectangle",
+                      "shiftedmesh")
+
+# One parent mesh of each geometric dimension
+_PARENTMESH_GDIM_PARAMS = ("interval", "square", "cube")
+
+_FUNCTIONSPACE_KINDS = ("scalar", "vector", "scalar_io", "vector_io")
+
+
+def _immersed_sphere_mesh():
+    m = UnitIcosahedralSphereMesh(refinement_level=2, name='immersedsphere')
+    m.init_cell_orientations(SpatialCoordinate(m))
+    return m
+
+
+def _shifted_mesh():
+    m = UnitSquareMesh(10, 10)
+    m.coordinates.dat.data[:] -= 0.5
+    return m
+
+
+_MESH_FACTORIES = {
+    "interval": lambda: UnitIntervalMesh(1),
+    "square": lambda: UnitSquareMesh(1, 1),
+    "squarequads": lambda: UnitSquareMesh(2, 2, quadrilateral=True),
+    "extruded": lambda: ExtrudedMesh(UnitSquareMesh(2, 2), 3),
+    "extrudedvariablelayers": lambda: ExtrudedMesh(UnitIntervalMesh(3), np.array([[0, 3], [0, 3], [0, 2]]), np.array([3, 3, 2])),
+    "cube": lambda: UnitCubeMesh(1, 1, 1),
+    "tetrahedron": lambda: UnitTetrahedronMesh(),
+    "immersedsphere": _immersed_sphere_mesh,
+    "immersedsphereextruded": _immersed_sphere_mesh,
+    "periodicrectangle": lambda: PeriodicRectangleMesh(3, 3, 1, 1),
+    "shiftedmesh": _shifted_mesh,
+}
+
+
+@pytest.fixture(scope="module", params=_PARENTMESH_PARAMS)
 def parentmesh(request):
-    if request.param == "interval":
-        return UnitIntervalMesh(1)
-    elif request.param == "square":
-        return UnitSquareMesh(1, 1)
-    elif request.param == "squarequads":
-        return UnitSquareMesh(2, 2, quadrilateral=True)
-    elif request.param == "extruded":
-        return ExtrudedMesh(UnitSquareMesh(2, 2), 3)
-    elif request.param == "extrudedvariablelayers":
-        return ExtrudedMesh(UnitIntervalMesh(3), np.array([[0, 3], [0, 3], [0, 2]]), np.array([3, 3, 2]))
-    elif request.param == "cube":
-        return UnitCubeMesh(1, 1, 1)
-    elif request.param == "tetrahedron":
-        return UnitTetrahedronMesh()
-    elif request.param == "immersedsphere":
-        m = UnitIcosahedralSphereMesh(refinement_level=2, name='immersedsphere')
-        m.init_cell_orientations(SpatialCoordinate(m))
-        return m
-    elif request.param == "immersedsphereextruded":
-        m = UnitIcosahedralSphereMesh(refinement_level=2, name='immersedsphere')
-        m.init_cell_orientations(SpatialCoordinate(m))
-        return m
-    elif request.param == "periodicrectangle":
-        return PeriodicRectangleMesh(3, 3, 1, 1)
-    elif request.param == "shiftedmesh":
-        m = UnitSquareMesh(10, 10)
-        m.coordinates.dat.data[:] -= 0.5
-        return m
-
-
-@pytest.fixture(params=[0, 1, 100], ids=lambda x: f"{x}-coords")
+    return _MESH_FACTORIES[request.param]()
+
+
+@pytest.fixture(scope="module", params=[0, 1, 100], ids=lambda x: f"{x}-coords")
 def vertexcoords(request, parentmesh):
     size = (request.param, parentmesh.geometric_dimension())
     return pseudo_random_coords(size)
 
 
+@pytest.fixture(scope="module")
+def vertexonlymesh(parentmesh, vertexcoords):
+    return VertexOnlyMesh(parentmesh, vertexcoords, missing_points_behaviour=None)
+
+
+# Pool of pseudo random coordinates with coordinate elements between -0.5 and
+# 1.5, large enough for every `vertexcoords` parametrisation.
+_POOL = -0.5 + 2.0 * np.random.default_rng(0).random((100, 3))
+
+
 def pseudo_random_coords(size):
     """
     Get an array of pseudo random coordinates with coordinate elements
     between -0.5 and 1.5. The random numbers are consistent for any
-    given `size` since `numpy.random.seed(0)` is called each time this
-    is used.
+    given `size` since they are sliced from a pre-generated pool.
+    """
+    return _POOL[:size[0], :size[1]].copy()
+
+
+_include_mask_cache = weakref.WeakKeyDictionary()
+
+
+def _include_mask(vm):
+    """
+    Get a boolean mask of the points in ``vm.input_ordering`` which were
+    found in the parent mesh. The mask is cached for each ``vm`` since it is
+    needed by both the scalar and vector function space tests.
+    """
+    try:
+        return _include_mask_cache[vm]
+    except KeyError:
+        input_ordering_parent_cell_nums = vm.input_ordering.topology_dm.getField("parentcellnum")
+        vm.input_ordering.topology_dm.restoreField("parentcellnum")
+        mask = _include_mask_cache[vm] = input_ordering_parent_cell_nums != -1
+        return mask
+
+
+_global_num_cells_cache = weakref.WeakKeyDictionary()
+
+
+def _global_num_cells(vm):
     """
-    np.random.seed(0)
-    a, b = -0.5, 1.5
-    return (b - a) * np.random.random_sample(size=size) + a
+    Get the number of cells of ``vm`` across all ranks of its communicator.
+    This is cached for each ``vm`` so the scalar and vector function space
+    tests only do the reduction once per mesh.
+    """
+    try:
+        return _global_num_cells_cache[vm]
+    except KeyError:
+        num_cells = _global_num_cells_cache[vm] = vm.comm.allreduce(len(vm.coordinates.dat.data_ro), op=MPI.SUM)
+        return num_cells
+
+
+def _point_product(coords, gdim):
+    """
+    Get the product of the components of each point in ``coords``, i.e. x
+    in 1D, x*y in 2D and x*y*z in 3D.
+    """
+    # Reshaping because for all meshes, we want (-1, gdim) but
+    # when gdim == 1 PyOP2 doesn't distinguish between dats with shape
+    # () and shape (1,).
+    c = coords.reshape(-1, gdim)
+    if gdim == 1:
+        return c[:, 0]
+    elif gdim == 2:
+        return c[:, 0]*c[:, 1]
+    else:
+        return c[:, 0]*c[:, 1]*c[:, 2]
 
 
 # Function Space Generation Tests
 
-def functionspace_tests(vm):
+def interpolation_api_tests(g, h, W, idxs_to_include):
+    """Check that each way of interpolating ``g`` into ``W`` agrees with
+    ``h``, which is ``g`` interpolated into ``W``, at ``idxs_to_include``."""
+    I = Interpolator(g, W)
+
+    def assemble_into_tensor():
+        # Check the tensor we pass in rather than the return value
+        tensor = Function(W)
+        assemble(I.interpolate(), tensor=tensor)
+        return tensor
+
+    # (interpolation, scaling of h expected from the interpolation)
+    cases = [(lambda: assemble(interpolate(g, W)), 1),
+             (lambda: assemble(I.interpolate()), 1),
+             (assemble_into_tensor, 1),
+             (lambda: Function(W).interpolate(2*g), 2)]
+    expected = h.dat.data_ro_with_halos[idxs_to_include]
+    for interpolation, scale in cases:
+        h2 = interpolation()
+        assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], scale*expected)
+
+
+def functionspace_tests(vm, V, W, I_io, I_io_transpose, I2_io, I2_io_transpose):
     # Prep
     num_cells = len(vm.coordinates.dat.data_ro)
-    num_cells_mpi_global = MPI.COMM_WORLD.allreduce(num_cells, op=MPI.SUM)
+    num_cells_mpi_global = _global_num_cells(vm)
     num_cells_halo = len(vm.coordinates.dat.data_ro_with_halos) - num_cells
-    # Can create DG0 function space
-    V = FunctionSpace(vm, "DG", 0)
-    # Can't create with degree > 0
-    with pytest.raises(ValueError):
-        V = FunctionSpace(vm, "DG", 1)
+    # The expected values of x in 1D, x*y in 2D, x*y*z in 3D at each vertex.
+    gdim = vm.geometric_dimension()
+    expected = _point_product(vm.coordinates.dat.data_ro, gdim)
+    expected_with_halos = _point_product(vm.coordinates.dat.data_ro_with_halos, gdim)
     # Can create function on function spaces
     f = Function(V)
     g = Function(V)
     # Make expr which is x in 1D, x*y in 2D, x*y*z in 3D
-    from functools import reduce
-    from operator import mul
     expr = reduce(mul, SpatialCoordinate(vm))
-    # Can interpolate and Galerkin project expressions onto functions
+    # Can interpolate expressions onto functions. Galerkin projection gives
+    # the same result (see test_projection) so we copy rather than project.
     f.interpolate(expr)
-    g.project(expr)
+    g.assign(f)
     # Should have 1 DOF per cell so check DOF DataSet
     assert f.dof_dset.size == g.dof_dset.size == vm.cell_set.size == num_cells
     assert f.dof_dset.total_size == g.dof_dset.total_size == vm.cell_set.total_size == num_cells + num_cells_halo
     # The function should take on the value of the expression applied to
     # the vertex only mesh coordinates (with no change to coordinate ordering)
-    # Reshaping because for all meshes, we want (-1, gdim) but
-    # when gdim == 1 PyOP2 doesn't distinguish between dats with shape
-    # () and shape (1,).
-    assert np.allclose(f.dat.data_ro, np.prod(vm.coordinates.dat.data_ro.reshape(-1, vm.geometric_dimension()), axis=1))
-    # Galerkin Projection of expression is the same as interpolation of
-    # that expression since both exactly point evaluate the expression.
-    assert np.allclose(f.dat.data_ro, g.dat.data_ro)
+    assert np.allclose(f.dat.data_ro, expected)
     # Assembly works as expected - global assembly (integration) of a
     # constant on a vertex only mesh is evaluation of that constant
     # num_vertices (globally) times
@@ -109,99 +192,83 @@ def functionspace_tests(vm):
     if "input_ordering" in vm.name:
         assert vm.input_ordering is None
         return
+    if W is None:
+        # There are no input points, so nothing to interpolate
+        assert num_cells_mpi_global == 0
+        return
     # Can interpolate onto the input ordering VOM and we retain values from the
     # expresson on the main VOM
-    W = FunctionSpace(vm.input_ordering, "DG", 0)
     h = Function(W)
     h.dat.data_wo_with_halos[:] = -1
     h.interpolate(g)
     # Exclude points which we know are missing - these should all be equal to -1
-    input_ordering_parent_cell_nums = vm.input_ordering.topology_dm.getField("parentcellnum")
-    vm.input_ordering.topology_dm.restoreField("parentcellnum")
-    idxs_to_include = input_ordering_parent_cell_nums != -1
-    assert np.allclose(h.dat.data_ro_with_halos[idxs_to_include], np.prod(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include].reshape(-1, vm.input_ordering.geometric_dimension()), axis=1))
-    assert np.all(h.dat.data_ro_with_halos[~idxs_to_include] == -1)
-    # check other interpolation APIs work identically
-    h2 = assemble(interpolate(g, W))
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], h.dat.data_ro_with_halos[idxs_to_include])
-    I = Interpolator(g, W)
-    h2 = assemble(I.interpolate())
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], h.dat.data_ro_with_halos[idxs_to_include])
-    h2.zero()
-    assemble(I.interpolate(), tensor=h2)
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], h.dat.data_ro_with_halos[idxs_to_include])
-    # check we can interpolate expressions
-    h2 = Function(W)
-    h2.interpolate(2*g)
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], 2*np.prod(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include].reshape(-1, vm.input_ordering.geometric_dimension()), axis=1))
+    idxs_to_include = _include_mask(vm)
+    idxs_to_exclude = ~idxs_to_include
+    expected_io = _point_product(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include], gdim)
+    assert np.allclose(h.dat.data_ro_with_halos[idxs_to_include], expected_io)
+    np.testing.assert_array_equal(h.dat.data_ro_with_halos[idxs_to_exclude], -1)
+    # check other interpolation APIs work identically and that we can
+    # interpolate expressions
+    interpolation_api_tests(g, h, W, idxs_to_include)
     # Check that the opposite works
     g.dat.data_wo_with_halos[:] = -1
     g.interpolate(h)
-    assert np.allclose(g.dat.data_ro_with_halos, np.prod(vm.coordinates.dat.data_ro_with_halos.reshape(-1, vm.geometric_dimension()), axis=1))
-    # Can equivalently create interpolators and use them. NOTE the
-    # transpose interpolator is equivilent to the inverse here because the
-    # inner product matrix in the reisz representer is the identity. TODO: when
-    # we introduce cofunctions, this will need to be rewritten.
-    I_io = Interpolator(TestFunction(V), W)
+    assert np.allclose(g.dat.data_ro_with_halos, expected_with_halos)
+    # Can equivalently use interpolators. NOTE the transpose interpolator is
+    # equivilent to the inverse here because the inner product matrix in the
+    # reisz representer is the identity. TODO: when we introduce cofunctions,
+    # this will need to be rewritten.
     h = assemble(I_io.interpolate(g))
-    assert np.allclose(h.dat.data_ro_with_halos[idxs_to_include], np.prod(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include].reshape(-1, vm.input_ordering.geometric_dimension()), axis=1))
-    assert np.all(h.dat.data_ro_with_halos[~idxs_to_include] == 0)
-    I2_io = Interpolator(2*TestFunction(V), W)
+    assert np.allclose(h.dat.data_ro_with_halos[idxs_to_include], expected_io)
+    np.testing.assert_array_equal(h.dat.data_ro_with_halos[idxs_to_exclude], 0)
     h2 = assemble(I2_io.interpolate(g))
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], 2*np.prod(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include].reshape(-1, vm.input_ordering.geometric_dimension()), axis=1))
+    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], 2*expected_io)
 
     h_star = h.riesz_representation(riesz_map="l2")
     g = assemble(I_io.interpolate(h_star, transpose=True))
-    assert np.allclose(g.dat.data_ro_with_halos, np.prod(vm.coordinates.dat.data_ro_with_halos.reshape(-1, vm.geometric_dimension()), axis=1))
+    assert np.allclose(g.dat.data_ro_with_halos, expected_with_halos)
     with pytest.raises(NotImplementedError):
         # Can't use transpose on interpolators with expressions yet
         g2 = assemble(I2_io.interpolate(h_star, transpose=True))
-        assert np.allclose(g2.dat.data_ro_with_halos, 2*np.prod(vm.coordinates.dat.data_ro_with_halos.reshape(-1, vm.geometric_dimension()), axis=1))
+        assert np.allclose(g2.dat.data_ro_with_halos, 2*expected_with_halos)
 
-    I_io_transpose = Interpolator(TestFunction(W), V)
-    I2_io_transpose = Interpolator(2*TestFunction(W), V)
     h_star = assemble(I_io_transpose.interpolate(g, transpose=True))
     h = h_star.riesz_representation(riesz_map="l2")
-    assert np.allclose(h.dat.data_ro_with_halos[idxs_to_include], np.prod(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include].reshape(-1, vm.input_ordering.geometric_dimension()), axis=1))
-    assert np.all(h.dat.data_ro_with_halos[~idxs_to_include] == 0)
+    assert np.allclose(h.dat.data_ro_with_halos[idxs_to_include], expected_io)
+    np.testing.assert_array_equal(h.dat.data_ro_with_halos[idxs_to_exclude], 0)
 
     with pytest.raises(NotImplementedError):
         # Can't use transpose on interpolators with expressions yet
         h2 = assemble(I2_io_transpose.interpolate(g, transpose=True))
-        assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], 2*np.prod(vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include].reshape(-1, vm.input_ordering.geometric_dimension()), axis=1))
+        assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], 2*expected_io)
     g = assemble(I_io_transpose.interpolate(h))
-    assert np.allclose(g.dat.data_ro_with_halos, np.prod(vm.coordinates.dat.data_ro_with_halos.reshape(-1, vm.geometric_dimension()), axis=1))
+    assert np.allclose(g.dat.data_ro_with_halos, expected_with_halos)
     g2 = assemble(I2_io_transpose.interpolate(h))
-    assert np.allclose(g2.dat.data_ro_with_halos, 2*np.prod(vm.coordinates.dat.data_ro_with_halos.reshape(-1, vm.geometric_dimension()), axis=1))
+    assert np.allclose(g2.dat.data_ro_with_halos, 2*expected_with_halos)
 
 
-def vectorfunctionspace_tests(vm):
+def vectorfunctionspace_tests(vm, V, W, I_io, I_io_transpose, I2_io, I2_io_transpose):
     # Prep
     gdim = vm.geometric_dimension()
     num_cells = len(vm.coordinates.dat.data_ro)
-    num_cells_mpi_global = MPI.COMM_WORLD.allreduce(num_cells, op=MPI.SUM)
+    num_cells_mpi_global = _global_num_cells(vm)
     num_cells_halo = len(vm.coordinates.dat.data_ro_with_halos) - num_cells
-    # Can create DG0 function space
-    V = VectorFunctionSpace(vm, "DG", 0)
-    # Can't create with degree > 0
-    with pytest.raises(ValueError):
-        V = VectorFunctionSpace(vm, "DG", 1)
+    # The expected values of 2*x at each vertex
+    expected_with_halos = 2*vm.coordinates.dat.data_ro_with_halos
     # Can create functions on function spaces
     f = Function(V)
     g = Function(V)
-    # Can interpolate and Galerkin project onto functions
+    # Can interpolate onto functions. Galerkin projection gives the same
+    # result (see test_projection) so we copy rather than project.
     x = SpatialCoordinate(vm)
     f.interpolate(2*x)
-    g.project(2*x)
+    g.assign(f)
     # Should have 1 DOF per cell so check DOF DataSet
     assert f.dof_dset.size == g.dof_dset.size == vm.cell_set.size == num_cells
     assert f.dof_dset.total_size == g.dof_dset.total_size == vm.cell_set.total_size == num_cells + num_cells_halo
     # The function should take on the value of the expression applied to
     # the vertex only mesh coordinates (with no change to coordinate ordering)
     assert np.allclose(f.dat.data_ro, 2*vm.coordinates.dat.data_ro)
-    # Galerkin Projection of expression is the same as interpolation of
-    # that expression since both exactly point evaluate the expression.
-    assert np.allclose(f.dat.data_ro, g.dat.data_ro)
     # Assembly works as expected - global assembly (integration) of a
     # constant on a vertex only mesh is evaluation of that constant
     # num_vertices (globally) times. Note that we get a vertex cell for
@@ -214,83 +281,127 @@ def vectorfunctionspace_tests(vm):
     if "input_ordering" in vm.name:
         assert vm.input_ordering is None
         return
+    if W is None:
+        # There are no input points, so nothing to interpolate
+        assert num_cells_mpi_global == 0
+        return
     # Can interpolate onto the input ordering VOM and we retain values from the
     # expresson on the main VOM
-    W = VectorFunctionSpace(vm.input_ordering, "DG", 0)
     h = Function(W)
     h.dat.data_wo_with_halos[:] = -1
     h.interpolate(g)
     # Exclude points which we know are missing - these should all be equal to -1
-    input_ordering_parent_cell_nums = vm.input_ordering.topology_dm.getField("parentcellnum")
-    vm.input_ordering.topology_dm.restoreField("parentcellnum")
-    idxs_to_include = input_ordering_parent_cell_nums != -1
-    assert np.allclose(h.dat.data_ro[idxs_to_include], 2*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include])
-    assert np.all(h.dat.data_ro_with_halos[~idxs_to_include] == -1)
-    # check other interpolation APIs work identically
-    h2 = assemble(interpolate(g, W))
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], h.dat.data_ro_with_halos[idxs_to_include])
-    I = Interpolator(g, W)
-    h2 = assemble(I.interpolate())
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], h.dat.data_ro_with_halos[idxs_to_include])
-    h2.zero()
-    assemble(I.interpolate(), tensor=h2)
-    assert np.allclose(h2.dat.data_ro_with_halos[idxs_to_include], h.dat.data_ro_with_halos[idxs_to_include])
-    # check we can interpolate expressions
-    h2 = Function(W)
-    h2.interpolate(2*g)
-    assert np.allclose(h2.dat.data_ro[idxs_to_include], 4*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include])
+    idxs_to_include = _include_mask(vm)
+    idxs_to_exclude = ~idxs_to_include
+    expected_io = 2*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include]
+    assert np.allclose(h.dat.data_ro[idxs_to_include], expected_io)
+    np.testing.assert_array_equal(h.dat.data_ro_with_halos[idxs_to_exclude], -1)
+    # check other interpolation APIs work identically and that we can
+    # interpolate expressions
+    interpolation_api_tests(g, h, W, idxs_to_include)
     # Check that the opposite works
     g.dat.data_wo_with_halos[:] = -1
     g.interpolate(h)
-    assert np.allclose(g.dat.data_ro_with_halos, 2*vm.coordinates.dat.data_ro_with_halos)
-    # Can equivalently create interpolators and use them. NOTE the
-    # transpose interpolator is equivilent to the inverse here because the
-    # inner product matrix in the reisz representer is the identity. TODO: when
-    # we introduce cofunctions, this will need to be rewritten.
-    I_io = Interpolator(TestFunction(V), W)
+    assert np.allclose(g.dat.data_ro_with_halos, expected_with_halos)
+    # Can equivalently use interpolators. NOTE the transpose interpolator is
+    # equivilent to the inverse here because the inner product matrix in the
+    # reisz representer is the identity. TODO: when we introduce cofunctions,
+    # this will need to be rewritten.
     h = assemble(I_io.interpolate(g))
-    assert np.allclose(h.dat.data_ro[idxs_to_include], 2*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include])
-    assert np.all(h.dat.data_ro_with_halos[~idxs_to_include] == 0)
-    I2_io = Interpolator(2*TestFunction(V), W)
+    assert np.allclose(h.dat.data_ro[idxs_to_include], expected_io)
+    np.testing.assert_array_equal(h.dat.data_ro_with_halos[idxs_to_exclude], 0)
     h2 = assemble(I2_io.interpolate(g))
-    assert np.allclose(h2.dat.data_ro[idxs_to_include], 4*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include])
+    assert np.allclose(h2.dat.data_ro[idxs_to_include], 2*expected_io)
 
     h_star = h.riesz_representation(riesz_map="l2")
     g = assemble(I_io.interpolate(h_star, transpose=True))
-    assert np.allclose(g.dat.data_ro_with_halos, 2*vm.coordinates.dat.data_ro_with_halos)
+    assert np.allclose(g.dat.data_ro_with_halos, expected_with_halos)
     with pytest.raises(NotImplementedError):
         # Can't use transpose on interpolators with expressions yet
         g2 = assemble(I2_io.interpolate(h_star, transpose=True))
-        assert np.allclose(g2.dat.data_ro_with_halos, 4*vm.coordinates.dat.data_ro_with_halos)
+        assert np.allclose(g2.dat.data_ro_with_halos, 2*expected_with_halos)
 
-    I_io_transpose = Interpolator(TestFunction(W), V)
-    I2_io_transpose = Interpolator(2*TestFunction(W), V)
     h_star = assemble(I_io_transpose.interpolate(g, transpose=True))
-    assert np.allclose(h_star.dat.data_ro[idxs_to_include], 2*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include])
-    assert np.all(h_star.dat.data_ro_with_halos[~idxs_to_include] == 0)
+    assert np.allclose(h_star.dat.data_ro[idxs_to_include], expected_io)
+    np.testing.assert_array_equal(h_star.dat.data_ro_with_halos[idxs_to_exclude], 0)
     with pytest.raises(NotImplementedError):
         # Can't use transpose on interpolators with expressions yet
         h2 = assemble(I2_io_transpose.interpolate(g, transpose=True))
-        assert np.allclose(h2.dat.data_ro[idxs_to_include], 4*vm.input_ordering.coordinates.dat.data_ro_with_halos[idxs_to_include])
+        assert np.allclose(h2.dat.data_ro[idxs_to_include], 2*expected_io)
 
     h = h_star.riesz_representation(riesz_map="l2")
     g = assemble(I_io_transpose.interpolate(h))
-    assert np.allclose(g.dat.data_ro_with_halos, 2*vm.coordinates.dat.data_ro_with_halos)
+    assert np.allclose(g.dat.data_ro_with_halos, expected_with_halos)
     g2 = assemble(I2_io_transpose.interpolate(h))
-    assert np.allclose(g2.dat.data_ro_with_halos, 4*vm.coordinates.dat.data_ro_with_halos)
+    assert np.allclose(g2.dat.data_ro_with_halos, 2*expected_with_halos)
+
+
+def invalid_functionspace_tests(vm, space):
+    # Can't create with degree > 0
+    with pytest.raises(ValueError):
+        space(vm, "DG", 1)
 
 
-def test_functionspaces(parentmesh, vertexcoords):
-    vm = VertexOnlyMesh(parentmesh, vertexcoords, missing_points_behaviour=None)
-    functionspace_tests(vm)
-    vectorfunctionspace_tests(vm)
-    functionspace_tests(vm.input_ordering)
-    vectorfunctionspace_tests(vm.input_ordering)
+def build_spaces(vm, space):
+    """
+    Build the DG0 ``space`` on ``vm`` and on its input ordering, along with
+    the interpolators between them. The input ordering space and
+    interpolators are ``None`` if ``vm`` has no input ordering or if there
+    are no input points at all.
+    """
+    V = space(vm, "DG", 0)
+    if vm.input_ordering is None:
+        return V, None, None, None, None, None
+    W = space(vm.input_ordering, "DG", 0)
+    if W.dim() == 0:
+        return V, None, None, None, None, None
+    return (V, W,
+            Interpolator(TestFunction(V), W),
+            Interpolator(TestFunction(W), V),
+            Interpolator(2*TestFunction(V), W),
+            Interpolator(2*TestFunction(W), V))
+
+
+@pytest.mark.parametrize("kind", _FUNCTIONSPACE_KINDS)
+def test_functionspaces(vertexonlymesh, kind):
+    vm = vertexonlymesh.input_ordering if kind.endswith("_io") else vertexonlymesh
+    if kind.startswith("scalar"):
+        invalid_functionspace_tests(vm, FunctionSpace)
+        functionspace_tests(vm, *build_spaces(vm, FunctionSpace))
+    else:
+        invalid_functionspace_tests(vm, VectorFunctionSpace)
+        vectorfunctionspace_tests(vm, *build_spaces(vm, VectorFunctionSpace))
+
+
+@pytest.mark.parallel
+def test_functionspaces_parallel(vertexonlymesh):
+    # Each parallel test is run in its own subprocess so run every kind in
+    # one rather than paying the start up and mesh construction for each.
+    for kind in _FUNCTIONSPACE_KINDS:
+        test_functionspaces(vertexonlymesh, kind)
+
+
+@pytest.mark.parametrize("parentmesh", _PARENTMESH_GDIM_PARAMS, indirect=True)
+def test_projection(parentmesh):
+    gdim = parentmesh.geometric_dimension()
+    for num_points in (0, 100):
+        vm = VertexOnlyMesh(parentmesh, pseudo_random_coords((num_points, gdim)),
+                            missing_points_behaviour=None)
+        for mesh in (vm, vm.input_ordering):
+            x = SpatialCoordinate(mesh)
+            for space, expr in ((FunctionSpace, reduce(mul, x)), (VectorFunctionSpace, 2*x)):
+                V = space(mesh, "DG", 0)
+                f = Function(V).interpolate(expr)
+                g = Function(V).project(expr)
+                # Galerkin Projection of expression is the same as interpolation of
+                # that expression since both exactly point evaluate the expression.
+                assert np.allclose(f.dat.data_ro, g.dat.data_ro)
 
 
 @pytest.mark.parallel
-def test_functionspaces_parallel(parentmesh, vertexcoords):
-    test_functionspaces(parentmesh, vertexcoords)
+@pytest.mark.parametrize("parentmesh", _PARENTMESH_GDIM_PARAMS, indirect=True)
+def test_projection_parallel(parentmesh):
+    test_projection(parentmesh)
 
 
 @pytest.mark.parallel(nprocs=2)
@@ -336,9 +447,12 @@ def test_input_ordering_missing_point():
     P0DG = FunctionSpace(vm, "DG", 0)
     data_on_vm = Function(P0DG).interpolate(data_input_ordering)
 
-    # Check that the data is correct
-    for data_at_point, point in zip(data_on_vm.dat.data_ro_with_halos, vm.coordinates.dat.data_ro_with_halos):
-        assert data_at_point == data[points.flatten() == point]
+    # Check that the data is correct - points is sorted so we can look up
+    # where each vertex-only mesh point came from
+    vm_points = vm.coordinates.dat.data_ro_with_halos.flatten()
+    idxs = np.searchsorted(points.flatten(), vm_points)
+    assert np.array_equal(points.flatten()[idxs], vm_points)
+    assert np.array_equal(data_on_vm.dat.data_ro_with_halos, data[idxs])
 
     # change the data on the immersed vertex-only mesh
     data_on_vm.assign(2*data_on_vm)
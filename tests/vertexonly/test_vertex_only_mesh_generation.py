@@ -95,16 +95,18 @@ def vertexcoords(request, parentmesh):
     return pseudo_random_coords(size)
 
 
+# Pool of pseudo random coordinates with coordinate elements between -0.5 and
+# 1.5, large enough for every `vertexcoords` parametrisation.
+_POOL = -0.5 + 2.0 * np.random.default_rng(0).random((100, 3))
+
+
 def pseudo_random_coords(size):
     """
     Get an array of pseudo random coordinates with coordinate elements
     between -0.5 and 1.5. The random numbers are consistent for any
-    given `size` since `numpy.random.seed(0)` is called each time this
-    is used.
+    given `size` since they are sliced from a pre-generated pool.
     """
-    np.random.seed(0)
-    a, b = -0.5, 1.5
-    return (b - a) * np.random.random_sample(size=size) + a
+    return _POOL[:size[0], :size[1]].copy()
 
 
 # Mesh Generation Tests